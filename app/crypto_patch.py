@@ -1,20 +1,32 @@
 import hashlib
+from functools import partial
 
-def ripemd160_sha256(data):
-    sha = hashlib.sha256(data).digest()
+_sha256 = hashlib.sha256
+
+
+def _resolve_ripemd160():
+    """Pick the RIPEMD160 constructor once: OpenSSL if it has it, else PyCryptodome"""
     try:
-        # Try system hashlib first
-        return hashlib.new('ripemd160', sha).digest()
+        hashlib.new('ripemd160')
+        return partial(hashlib.new, 'ripemd160')
     except (ValueError, TypeError):
-        # Fallback to PyCryptodome
-        try:
-            from Crypto.Hash import RIPEMD160
-        except ImportError as e:
-            raise RuntimeError(
-                "Your system lacks ripemd160 and pycryptodome is not installed. "
-                "Install it with 'pip install pycryptodome'."
-            ) from e
+        pass
+    try:
+        from Crypto.Hash import RIPEMD160
+    except ImportError:
+        return None
+    return lambda data=b'', **kwargs: RIPEMD160.new(data)
 
-        h = RIPEMD160.new()
-        h.update(sha)
-        return h.digest()
+
+# Resolved at import so each call skips the failing OpenSSL probe and import;
+# shared with hashlib_patch so both resolve the backend the same way
+ripemd160_new = _resolve_ripemd160()
+
+
+def ripemd160_sha256(data):
+    if ripemd160_new is None:
+        raise RuntimeError(
+            "Your system lacks ripemd160 and pycryptodome is not installed. "
+            "Install it with 'pip install pycryptodome'."
+        )
+    return ripemd160_new(_sha256(data).digest()).digest()
@@ -1,26 +1,25 @@
 import hashlib
-from functools import partial
+
+from app.crypto_patch import ripemd160_new
 
 # Save the original constructor
 original_new = hashlib.new
 
+
+def _ripemd160_unavailable(data=b'', **kwargs):
+    raise RuntimeError(
+        "Your system lacks ripemd160 and pycryptodome is not installed. "
+        "Install with: pip install pycryptodome"
+    )
+
+
+# Bound once at import; bit/bitcoinlib call hashlib.new('ripemd160', ...) per address
+_ripemd160_factory = ripemd160_new or _ripemd160_unavailable
+
+
 def patched_new(name, data=b'', **kwargs):
-    if name.lower() == 'ripemd160':
-        try:
-            # Try system
-            return original_new(name, data, **kwargs)
-        except (ValueError, TypeError):
-            # Fallback to PyCryptodome
-            try:
-                from Crypto.Hash import RIPEMD160
-            except ImportError:
-                raise RuntimeError(
-                    "Your system lacks ripemd160 and pycryptodome is not installed. "
-                    "Install with: pip install pycryptodome"
-                )
-            h = RIPEMD160.new()
-            h.update(data)
-            return h
+    if name == 'ripemd160' or name.lower() == 'ripemd160':
+        return _ripemd160_factory(data, **kwargs)
     return original_new(name, data, **kwargs)
 
 # Patch it globally
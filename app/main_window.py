@@ -1,5 +1,5 @@
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtWidgets import QMainWindow, QDockWidget, QListWidget, QStackedWidget, QSizePolicy
+from PyQt6.QtWidgets import QMainWindow, QDockWidget, QListWidget, QStackedWidget, QSizePolicy, QWidget
 from PyQt6.QtGui import QFont
 from app.pages.home_page import HomePage
 from app.pages.apn_page import APNPage
@@ -8,9 +8,12 @@ from app.pages.map_page import MapPage
 from app.pages.nodes_page import NodesPage
 from app.pages.profile_page import ProfilePage
 from app.pages.devices_page import DevicesPage
-from app.ui.theme import APNTheme
 from app.ui.components import HolographicHeader
+from app.pages import globals
 from services.meshtastic_service import MeshtasticService
+from core.logging_config import get_logger
+
+logger = get_logger("main_window")
 
 class MainWindow(QMainWindow):
     def __init__(self, config=None):
@@ -25,9 +28,6 @@ class MainWindow(QMainWindow):
         # Enable window resizing
         self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowMaximizeButtonHint | Qt.WindowType.WindowMinimizeButtonHint)
         
-        # Apply the modern holographic theme
-        self.setStyleSheet(APNTheme.get_main_stylesheet())
-        
         # Set application font with fallbacks
         font = QFont()
         font.setFamily("SF Pro Display, Segoe UI, Arial, sans-serif")
@@ -64,28 +64,39 @@ class MainWindow(QMainWindow):
         self.stack.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setCentralWidget(self.stack)
 
-        # Initialize pages with config
+        # Initialize pages with config. Pages fed by the Meshtastic service
+        # are built now; the rest are built on first navigation.
         self.home_page = HomePage(config)
-        self.devices_page = DevicesPage(config)
-        self.apn_page = APNPage(config)
+        self.devices_page = None
+        self.apn_page = None
         self.chat_page = ChatPage(config)
         self.map_page = MapPage(config)
         self.nodes_page = NodesPage(config)
-        self.profile_page = ProfilePage(config)
+        self.profile_page = None
+
+        # stack index -> (attribute name, page class)
+        self._lazy_pages = {
+            1: ("devices_page", DevicesPage),
+            2: ("apn_page", APNPage),
+            6: ("profile_page", ProfilePage),
+        }
 
-        self.stack.addWidget(self.home_page)
-        self.stack.addWidget(self.devices_page)
-        self.stack.addWidget(self.apn_page)
-        self.stack.addWidget(self.chat_page)
-        self.stack.addWidget(self.map_page)
-        self.stack.addWidget(self.nodes_page)
-        self.stack.addWidget(self.profile_page)
+        for page in (self.home_page, None, None, self.chat_page,
+                     self.map_page, self.nodes_page, None):
+            self.stack.addWidget(page if page is not None else QWidget())
 
         # Meshtastic Service (like original working version)
         self.service = MeshtasticService()
         self.service.new_message.connect(self.chat_page.append_message)
         self.service.update_nodes.connect(self.update_nodes_all)
 
+        # Coalesce bursts of node updates into one page refresh
+        self._pending_nodes = None
+        self._nodes_flush_timer = QTimer(self)
+        self._nodes_flush_timer.setSingleShot(True)
+        self._nodes_flush_timer.setInterval(50)
+        self._nodes_flush_timer.timeout.connect(self._flush_nodes)
+
         # Set up periodic updates
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_dashboard)
@@ -100,20 +111,40 @@ class MainWindow(QMainWindow):
 
     def navigate(self, index):
         """Navigate to selected page"""
+        if index in self._lazy_pages:
+            self._build_page(index)
         self.stack.setCurrentIndex(index)
 
+    def _build_page(self, index):
+        """Replace the placeholder at index with its real page"""
+        attr, page_class = self._lazy_pages.pop(index)
+        page = page_class(self.config)
+        setattr(self, attr, page)
+        placeholder = self.stack.widget(index)
+        self.stack.insertWidget(index, page)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
     def update_dashboard(self):
         """Update dashboard with latest data from service manager"""
         try:
-            from app.pages import globals
             if hasattr(globals, 'service_manager') and globals.service_manager:
                 # This will be called periodically to refresh UI
                 pass
         except Exception as e:
-            print(f"Dashboard update error: {e}")
+            logger.exception(f"Dashboard update error: {e}")
 
     def update_nodes_all(self, nodes):
-        """Update all pages with node data"""
+        """Queue node data for the pages; only the latest table is applied"""
+        self._pending_nodes = nodes
+        if not self._nodes_flush_timer.isActive():
+            self._nodes_flush_timer.start()
+
+    def _flush_nodes(self):
+        """Update all pages with the most recent node data"""
+        nodes, self._pending_nodes = self._pending_nodes, None
+        if nodes is None:
+            return
         if hasattr(self.home_page, 'update_nodes'):
             self.home_page.update_nodes(nodes)
         if hasattr(self.map_page, 'update_nodes'):
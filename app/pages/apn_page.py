@@ -9,6 +9,10 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 
+from core.logging_config import get_logger
+
+logger = get_logger("apn_page")
+
 # Paths
 CONFIG_DIR = Path.home() / ".apn"
 CONFIG_PATH = CONFIG_DIR / "node_config.json"
@@ -214,6 +218,8 @@ class APNPage(QWidget):
 
             QMessageBox.information(self, "Success", "Node config saved!")
         except Exception as e:
+            # Full traceback goes to the log file; the dialog stays a one-liner
+            logger.exception("Failed to save node config")
             QMessageBox.critical(self, "Error", f"Failed to save config: {e}")
 
     # ================
@@ -248,6 +254,7 @@ class APNPage(QWidget):
                 self.bridge_price_input.setText(str(settings["bridge"].get("pricePerMB", "")))
 
         except Exception as e:
+            logger.exception("Failed to load node config")
             QMessageBox.critical(self, "Error", f"Failed to load config: {e}")
 
     # ================
@@ -1,12 +1,30 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QLineEdit, QPushButton, QHBoxLayout, QLabel
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPlainTextEdit, QLineEdit, QPushButton, QHBoxLayout, QLabel
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from app.ui.components import GlassCard, HolographicButton, HolographicHeader
 from app.ui.theme import APNTheme
+from services.meshtastic_service import MeshtasticService
+
+class MeshSendSignals(QObject):
+    """Signals emitted by MeshSendWorker"""
+    done = pyqtSignal(bool, str)  # success, text
+
+class MeshSendWorker(QRunnable):
+    """Broadcasts a text message without blocking the UI thread"""
+    
+    def __init__(self, text):
+        super().__init__()
+        self.text = text
+        self.signals = MeshSendSignals()
+        
+    def run(self):
+        success = MeshtasticService.sendChunked(self.text)
+        self.signals.done.emit(success, self.text)
 
 class ChatPage(QWidget):
     def __init__(self, config=None):
         super().__init__()
         self.config = config
+        self._send_worker = None
         self._setup_ui()
         
     def _setup_ui(self):
@@ -25,10 +43,11 @@ class ChatPage(QWidget):
         chat_layout.setSpacing(16)
         
         # Chat log with modern styling
-        self.chat_log = QTextEdit()
+        self.chat_log = QPlainTextEdit()
         self.chat_log.setReadOnly(True)
+        self.chat_log.setMaximumBlockCount(1000)
         self.chat_log.setStyleSheet(f"""
-            QTextEdit {{
+            QPlainTextEdit {{
                 background: {APNTheme.COLORS['bg_elevated']};
                 border: 1px solid {APNTheme.COLORS['border_primary']};
                 border-radius: 12px;
@@ -73,12 +92,12 @@ class ChatPage(QWidget):
         """)
         self.input.returnPressed.connect(self.send_message)
         
-        send_button = HolographicButton("Send Message", "primary")
-        send_button.clicked.connect(self.send_message)
-        send_button.setMinimumWidth(140)
+        self.send_button = HolographicButton("Send Message", "primary")
+        self.send_button.clicked.connect(self.send_message)
+        self.send_button.setMinimumWidth(140)
         
         input_layout.addWidget(self.input, 1)
-        input_layout.addWidget(send_button)
+        input_layout.addWidget(self.send_button)
         
         chat_layout.addLayout(input_layout)
         
@@ -91,15 +110,25 @@ class ChatPage(QWidget):
         self.append_message("🔒 End-to-end encrypted communication enabled")
 
     def append_message(self, msg):
-        self.chat_log.append(msg)
+        self.chat_log.appendPlainText(msg)
 
     def send_message(self):
+        if self._send_worker is not None:
+            return  # Previous message is still being transmitted
         text = self.input.text().strip()
         if text:
-            from services.meshtastic_service import MeshtasticService
-            success = MeshtasticService.sendText(text)
-            if success:
-                self.append_message(f"📤 You: {text}")
-            else:
-                self.append_message(f"❌ Failed to send: {text}")
+            # Serial/BLE writes can take seconds, so send on the thread pool
+            self.send_button.setEnabled(False)
+            worker = MeshSendWorker(text)
+            worker.signals.done.connect(self._on_send_done)
+            self._send_worker = worker
+            QThreadPool.globalInstance().start(worker)
             self.input.clear()
+
+    def _on_send_done(self, success, text):
+        self._send_worker = None
+        self.send_button.setEnabled(True)
+        if success:
+            self.append_message(f"📤 You: {text}")
+        else:
+            self.append_message(f"❌ Failed to send: {text}")
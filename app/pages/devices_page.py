@@ -3,22 +3,173 @@ Alpha Protocol Network - Devices Page
 Real hardware device management and connectivity (Meshtastic-inspired UI)
 """
 import asyncio
+import serial.tools.list_ports
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, 
-    QPushButton, QGroupBox, QProgressBar, QTextEdit, QFrame, QGridLayout,
+    QPushButton, QGroupBox, QProgressBar, QPlainTextEdit, QFrame, QGridLayout,
     QSizePolicy, QSpacerItem
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont
 from app.ui.components import GlassCard, HolographicButton, HolographicHeader, StatusIndicator
 from app.ui.theme import APNTheme
-from core.device_manager import DeviceManager
+from core.device_manager import APNDevice, DeviceManager
+from services.meshtastic_service import MeshtasticService
+
+def discover_serial_devices():
+    """Build APNDevice entries for the serial ports currently attached"""
+    # Get actual serial ports
+    ports = list(serial.tools.list_ports.comports())
+    devices = []
+    
+    for port in ports:
+        # Determine device type based on description
+        device_type = "unknown"
+        if any(term in port.description.lower() for term in ["esp32", "esp", "wemos", "nodemcu"]):
+            device_type = "esp32"
+        elif any(term in port.description.lower() for term in ["arduino", "uno", "mega"]):
+            device_type = "arduino"
+        elif "serial" in port.description.lower():
+            device_type = "serial"
+        
+        # Set capabilities based on type
+        capabilities = []
+        if device_type == "esp32":
+            capabilities = ["mesh_node", "lora", "wifi", "bluetooth"]
+        elif device_type == "arduino":
+            capabilities = ["sensor_node", "actuator"]
+        
+        device = APNDevice(
+            device_id=f"{device_type}_{port.device.replace('/', '_')}",
+            device_type=device_type,
+            port=port.device,
+            description=f"{port.description} ({device_type.upper()})",
+            vendor_id=f"{port.vid:04x}" if port.vid else None,
+            product_id=f"{port.pid:04x}" if port.pid else None,
+            status="discovered",
+            capabilities=capabilities,
+            metadata={
+                "manufacturer": port.manufacturer,
+                "serial_number": port.serial_number
+            }
+        )
+        devices.append(device)
+    
+    return devices
+
+class DeviceScanSignals(QObject):
+    """Signals emitted by DeviceScanWorker"""
+    finished = pyqtSignal(list)  # List[APNDevice]
+    failed = pyqtSignal(str)  # error message
+
+class DeviceScanWorker(QRunnable):
+    """Runs serial port discovery on the global thread pool"""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = DeviceScanSignals()
+        
+    def run(self):
+        try:
+            devices = discover_serial_devices()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(devices)
 
 class DeviceCard(QFrame):
     """Individual device card (Meshtastic-style)"""
     connect_requested = pyqtSignal(str)  # device_id
     disconnect_requested = pyqtSignal(str)  # device_id
     
+    DEVICE_ICONS = {
+        "esp32": "📡",
+        "arduino": "🔧",
+        "lora": "📻",
+        "bluetooth": "🔵",
+        "wifi": "📶",
+        "serial": "🔌",
+        "unknown": "❓"
+    }
+    # Description markers checked in order, before falling back to the device type
+    DESCRIPTION_NAMES = (
+        ("ESP32", "ESP32 Device"),
+        ("ARDUINO", "Arduino Board"),
+    )
+    TYPE_NAMES = {"esp32": "ESP32 Device"}
+    # Device status -> StatusIndicator state
+    STATUS_STATES = {
+        "connected": "online",
+        "discovered": "info",
+    }
+    
+    # Stylesheets are shared by every card, so build them once per class
+    CARD_STYLE = f"""
+        DeviceCard {{
+            background: qlineargradient(
+                x1: 0, y1: 0, x2: 1, y2: 1,
+                stop: 0 {APNTheme.COLORS['glass_primary']},
+                stop: 1 {APNTheme.COLORS['glass_secondary']}
+            );
+            border: 2px solid {APNTheme.COLORS['border_primary']};
+            border-radius: 16px;
+            margin: 8px;
+            padding: 16px;
+        }}
+        DeviceCard:hover {{
+            border: 2px solid {APNTheme.COLORS['alpha_gold']};
+        }}
+    """
+    ICON_STYLE = f"""
+        QLabel {{
+            font-size: 24px;
+            color: {APNTheme.COLORS['alpha_gold']};
+            min-width: 32px;
+            max-width: 32px;
+        }}
+    """
+    NAME_STYLE = f"""
+        QLabel {{
+            color: {APNTheme.COLORS['text_primary']};
+            font-weight: 700;
+            font-size: 16px;
+        }}
+    """
+    PORT_STYLE = f"""
+        QLabel {{
+            color: {APNTheme.COLORS['text_secondary']};
+            font-size: 13px;
+            font-family: 'Courier New', monospace;
+        }}
+    """
+    HARDWARE_STYLE = f"""
+        QLabel {{
+            color: {APNTheme.COLORS['text_muted']};
+            font-size: 12px;
+            font-family: 'Courier New', monospace;
+        }}
+    """
+    CAPABILITY_CHIP_STYLE = f"""
+        QLabel {{
+            background: {APNTheme.COLORS['alpha_gold']};
+            color: {APNTheme.COLORS['bg_primary']};
+            border-radius: 8px;
+            padding: 2px 6px;
+            font-size: 10px;
+            font-weight: 600;
+        }}
+    """
+    MORE_CHIP_STYLE = f"""
+        QLabel {{
+            background: {APNTheme.COLORS['text_muted']};
+            color: {APNTheme.COLORS['bg_primary']};
+            border-radius: 8px;
+            padding: 2px 6px;
+            font-size: 10px;
+            font-weight: 600;
+        }}
+    """
+    
     def __init__(self, device, parent=None):
         super().__init__(parent)
         self.device = device
@@ -30,22 +181,7 @@ class DeviceCard(QFrame):
         self.setFixedWidth(320)
         
         # Card styling
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 {APNTheme.COLORS['glass_primary']},
-                    stop: 1 {APNTheme.COLORS['glass_secondary']}
-                );
-                border: 2px solid {APNTheme.COLORS['border_primary']};
-                border-radius: 16px;
-                margin: 8px;
-                padding: 16px;
-            }}
-            QFrame:hover {{
-                border: 2px solid {APNTheme.COLORS['alpha_gold']};
-            }}
-        """)
+        self.setStyleSheet(self.CARD_STYLE)
         
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(16, 16, 16, 16)
@@ -57,31 +193,18 @@ class DeviceCard(QFrame):
         # Device type icon and name
         device_icon = self._get_device_icon()
         icon_label = QLabel(device_icon)
-        icon_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 24px;
-                color: {APNTheme.COLORS['alpha_gold']};
-                min-width: 32px;
-                max-width: 32px;
-            }}
-        """)
+        icon_label.setStyleSheet(self.ICON_STYLE)
         header_layout.addWidget(icon_label)
         
         # Device name
         name_label = QLabel(self._get_device_name())
-        name_label.setStyleSheet(f"""
-            QLabel {{
-                color: {APNTheme.COLORS['text_primary']};
-                font-weight: 700;
-                font-size: 16px;
-            }}
-        """)
+        name_label.setStyleSheet(self.NAME_STYLE)
         header_layout.addWidget(name_label, 1)
         
         # Status indicator
         status_color = self._get_status_color()
-        status_indicator = StatusIndicator(status_color, self.device.status.upper())
-        header_layout.addWidget(status_indicator)
+        self.status_indicator = StatusIndicator(status_color, self.device.status.upper())
+        header_layout.addWidget(self.status_indicator)
         
         main_layout.addLayout(header_layout)
         
@@ -91,25 +214,13 @@ class DeviceCard(QFrame):
         
         # Port
         port_label = QLabel(f"Port: {self.device.port}")
-        port_label.setStyleSheet(f"""
-            QLabel {{
-                color: {APNTheme.COLORS['text_secondary']};
-                font-size: 13px;
-                font-family: 'Courier New', monospace;
-            }}
-        """)
+        port_label.setStyleSheet(self.PORT_STYLE)
         details_layout.addWidget(port_label)
         
         # Hardware info
         if self.device.vendor_id and self.device.product_id:
             hw_label = QLabel(f"Hardware: {self.device.vendor_id}:{self.device.product_id}")
-            hw_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {APNTheme.COLORS['text_muted']};
-                    font-size: 12px;
-                    font-family: 'Courier New', monospace;
-                }}
-            """)
+            hw_label.setStyleSheet(self.HARDWARE_STYLE)
             details_layout.addWidget(hw_label)
         
         # Capabilities chips
@@ -119,30 +230,12 @@ class DeviceCard(QFrame):
             
             for cap in self.device.capabilities[:3]:  # Show max 3 capabilities
                 cap_chip = QLabel(cap)
-                cap_chip.setStyleSheet(f"""
-                    QLabel {{
-                        background: {APNTheme.COLORS['alpha_gold']};
-                        color: {APNTheme.COLORS['bg_primary']};
-                        border-radius: 8px;
-                        padding: 2px 6px;
-                        font-size: 10px;
-                        font-weight: 600;
-                    }}
-                """)
+                cap_chip.setStyleSheet(self.CAPABILITY_CHIP_STYLE)
                 caps_layout.addWidget(cap_chip)
             
             if len(self.device.capabilities) > 3:
                 more_chip = QLabel(f"+{len(self.device.capabilities) - 3}")
-                more_chip.setStyleSheet(f"""
-                    QLabel {{
-                        background: {APNTheme.COLORS['text_muted']};
-                        color: {APNTheme.COLORS['bg_primary']};
-                        border-radius: 8px;
-                        padding: 2px 6px;
-                        font-size: 10px;
-                        font-weight: 600;
-                    }}
-                """)
+                more_chip.setStyleSheet(self.MORE_CHIP_STYLE)
                 caps_layout.addWidget(more_chip)
                 
             caps_layout.addStretch()
@@ -161,36 +254,20 @@ class DeviceCard(QFrame):
         
     def _get_device_icon(self):
         """Get icon for device type"""
-        icons = {
-            "esp32": "📡",
-            "arduino": "🔧", 
-            "lora": "📻",
-            "bluetooth": "🔵",
-            "wifi": "📶",
-            "serial": "🔌",
-            "unknown": "❓"
-        }
-        return icons.get(self.device.device_type, "❓")
+        return self.DEVICE_ICONS.get(self.device.device_type, "❓")
     
     def _get_device_name(self):
         """Get clean device name"""
-        if "ESP32" in self.device.description.upper():
-            return "ESP32 Device"
-        elif "ARDUINO" in self.device.description.upper():
-            return "Arduino Board"
-        elif self.device.device_type == "esp32":
-            return "ESP32 Device"
-        else:
-            return self.device.device_type.title() + " Device"
+        description = self.device.description.upper()
+        for marker, name in self.DESCRIPTION_NAMES:
+            if marker in description:
+                return name
+        device_type = self.device.device_type
+        return self.TYPE_NAMES.get(device_type) or device_type.title() + " Device"
     
     def _get_status_color(self):
-        """Get status indicator color"""
-        if self.device.status == "connected":
-            return "success"
-        elif self.device.status == "discovered":
-            return "info"
-        else:
-            return "warning"
+        """Get status indicator state"""
+        return self.STATUS_STATES.get(self.device.status, "warning")
     
     def _on_action_clicked(self):
         """Handle connect/disconnect action"""
@@ -201,8 +278,14 @@ class DeviceCard(QFrame):
     
     def update_device(self, device):
         """Update device information"""
+        # Status changes only flip dynamic properties; the card is not rebuilt
         self.device = device
-        self._setup_ui()
+        connected = device.status == "connected"
+        self.status_indicator.set_status(self._get_status_color(), device.status.upper())
+        action_text = "❌ Disconnect" if connected else "🔗 Connect"
+        if self.action_btn.text() != action_text:
+            self.action_btn.setText(action_text)
+        self.action_btn.set_variant("secondary" if connected else "primary")
 
 class DevicesPage(QWidget):
     device_connected = pyqtSignal(str)  # device_id
@@ -212,6 +295,10 @@ class DevicesPage(QWidget):
         super().__init__()
         self.config = config
         self.device_manager = DeviceManager()
+        self._scan_worker = None
+        self._label_text = {}  # label -> text last applied by _set_label_text
+        self._device_signature = None  # which devices the current cards were built for
+        self._device_cards = []  # DeviceCards in device order
         self._setup_ui()
         self._setup_device_scanning()
         
@@ -382,11 +469,12 @@ class DevicesPage(QWidget):
         console_layout.addWidget(console_title)
         
         # Console output
-        self.console_output = QTextEdit()
+        self.console_output = QPlainTextEdit()
         self.console_output.setReadOnly(True)
+        self.console_output.setMaximumBlockCount(500)
         self.console_output.setMaximumHeight(80)
         self.console_output.setStyleSheet(f"""
-            QTextEdit {{
+            QPlainTextEdit {{
                 background: {APNTheme.COLORS['bg_elevated']};
                 border: 1px solid {APNTheme.COLORS['border_primary']};
                 border-radius: 8px;
@@ -412,100 +500,86 @@ class DevicesPage(QWidget):
     
     def _scan_devices(self):
         """Scan for available devices"""
+        if self._scan_worker is not None:
+            return  # A scan is already running
+
         self.scan_btn.setEnabled(False)
         self.scan_btn.setText("🔄 Scanning...")
         self._log_to_console("Scanning for APN-compatible devices...")
         
-        # For now, simulate device scanning without async
-        self._simulate_device_scan()
+        # Enumerate ports on the thread pool so the UI stays responsive
+        worker = DeviceScanWorker()
+        worker.signals.finished.connect(self._on_scan_finished)
+        worker.signals.failed.connect(self._on_scan_failed)
+        self._scan_worker = worker
+        QThreadPool.globalInstance().start(worker)
     
-    def _simulate_device_scan(self):
-        """Simulate device scanning for demo purposes"""
-        try:
-            import serial.tools.list_ports
-            
-            # Get actual serial ports
-            ports = list(serial.tools.list_ports.comports())
-            devices = []
-            
-            for port in ports:
-                from core.device_manager import APNDevice
-                
-                # Determine device type based on description
-                device_type = "unknown"
-                if any(term in port.description.lower() for term in ["esp32", "esp", "wemos", "nodemcu"]):
-                    device_type = "esp32"
-                elif any(term in port.description.lower() for term in ["arduino", "uno", "mega"]):
-                    device_type = "arduino"
-                elif "serial" in port.description.lower():
-                    device_type = "serial"
-                
-                # Set capabilities based on type
-                capabilities = []
-                if device_type == "esp32":
-                    capabilities = ["mesh_node", "lora", "wifi", "bluetooth"]
-                elif device_type == "arduino":
-                    capabilities = ["sensor_node", "actuator"]
-                
-                device = APNDevice(
-                    device_id=f"{device_type}_{port.device.replace('/', '_')}",
-                    device_type=device_type,
-                    port=port.device,
-                    description=f"{port.description} ({device_type.upper()})",
-                    vendor_id=f"{port.vid:04x}" if port.vid else None,
-                    product_id=f"{port.pid:04x}" if port.pid else None,
-                    status="discovered",
-                    capabilities=capabilities,
-                    metadata={
-                        "manufacturer": port.manufacturer,
-                        "serial_number": port.serial_number
-                    }
-                )
-                devices.append(device)
-            
-            # Update device manager
-            self.device_manager.devices = devices
-            
-            # Update UI
-            self._update_device_lists(devices)
-            
-            if devices:
-                self._log_to_console(f"Found {len(devices)} potential APN devices")
-            else:
-                self._log_to_console("No serial devices found. Connect ESP32 or other devices and scan again.")
-            
-        except Exception as e:
-            self._log_to_console(f"Device scan error: {e}")
-        finally:
-            # Re-enable scan button
-            self.scan_btn.setEnabled(True)
-            self.scan_btn.setText("🔍 Scan for Devices")
+    def _on_scan_finished(self, devices):
+        """Apply the results of a background device scan"""
+        self._scan_worker = None
+        
+        # Update device manager
+        self.device_manager.devices = devices
+        
+        # Update UI
+        self._update_device_lists(devices)
+        
+        if devices:
+            self._log_to_console(f"Found {len(devices)} potential APN devices")
+        else:
+            self._log_to_console("No serial devices found. Connect ESP32 or other devices and scan again.")
+        
+        self._reset_scan_button()
+    
+    def _on_scan_failed(self, error):
+        """Report a failed background device scan"""
+        self._scan_worker = None
+        self._log_to_console(f"Device scan error: {error}")
+        self._reset_scan_button()
+    
+    def _reset_scan_button(self):
+        """Re-enable the scan button after a scan completes"""
+        self.scan_btn.setEnabled(True)
+        self.scan_btn.setText("🔍 Scan for Devices")
     
     def _update_device_lists(self, devices):
         """Update device cards in grid layout"""
+        # Rescans and connect/disconnect usually keep the same devices; then
+        # only statuses can differ and the existing cards are updated in place
+        signature = tuple(
+            (d.device_id, d.device_type, d.description, d.vendor_id, d.product_id,
+             tuple(d.capabilities))
+            for d in devices
+        )
+        if signature == self._device_signature:
+            for card, device in zip(self._device_cards, devices):
+                card.update_device(device)
+            self._update_device_status(devices)
+            return
+        self._device_signature = signature
+        
+        # Rebuild the grid with painting suspended so it is laid out and drawn once
+        self.devices_container.setUpdatesEnabled(False)
+        try:
+            self._populate_device_grid(devices)
+        finally:
+            self.devices_container.setUpdatesEnabled(True)
+    
+    def _populate_device_grid(self, devices):
+        """Replace the device cards with one card per device"""
         # Clear existing cards
         for i in reversed(range(self.devices_layout.count())):
             child = self.devices_layout.itemAt(i).widget()
             if child:
                 child.setParent(None)
+        self._device_cards = []
         
-        # Update device count
-        device_count = len(devices)
-        connected_count = sum(1 for d in devices if d.status == "connected")
+        device_count, connected_count = self._update_device_status(devices)
         
         if device_count == 0:
             self._show_empty_state()
-            self.device_count_label.setText("0 devices found")
-            self.status_label.setText("No devices detected")
             return
         
-        # Update status
-        self.device_count_label.setText(f"{device_count} devices found")
-        if connected_count > 0:
-            self.status_label.setText(f"{connected_count} connected to APN network")
-        else:
-            self.status_label.setText("Ready to connect devices")
-        
         # Create device cards in grid
         cards_per_row = 3  # Adjust based on card width
         row = 0
@@ -516,6 +590,7 @@ class DevicesPage(QWidget):
             device_card = DeviceCard(device)
             device_card.connect_requested.connect(self._connect_device)
             device_card.disconnect_requested.connect(self._disconnect_device)
+            self._device_cards.append(device_card)
             
             # Add to grid
             self.devices_layout.addWidget(device_card, row, col)
@@ -531,6 +606,28 @@ class DevicesPage(QWidget):
         
         self._log_to_console(f"Found {device_count} devices ({connected_count} connected)")
     
+    def _update_device_status(self, devices):
+        """Refresh the device count and status labels; returns (total, connected)"""
+        device_count = len(devices)
+        connected_count = sum(1 for d in devices if d.status == "connected")
+        
+        if device_count == 0:
+            self._set_label_text(self.device_count_label, "0 devices found")
+            self._set_label_text(self.status_label, "No devices detected")
+        else:
+            self._set_label_text(self.device_count_label, f"{device_count} devices found")
+            if connected_count > 0:
+                self._set_label_text(self.status_label, f"{connected_count} connected to APN network")
+            else:
+                self._set_label_text(self.status_label, "Ready to connect devices")
+        return device_count, connected_count
+    
+    def _set_label_text(self, label, text):
+        """setText only when the text differs from what was last applied"""
+        if self._label_text.get(label) != text:
+            self._label_text[label] = text
+            label.setText(text)
+    
     def _connect_device(self, device_id):
         """Connect a specific device"""
         device = self.device_manager.get_device(device_id)
@@ -539,7 +636,6 @@ class DevicesPage(QWidget):
             
             # Try to connect through Meshtastic service for ESP32/LoRa devices
             if device.device_type in ["esp32", "lora"]:
-                from services.meshtastic_service import MeshtasticService
                 try:
                     # If this device port matches meshtastic, it should already be connected
                     if MeshtasticService.iface is not None:
@@ -577,7 +673,7 @@ class DevicesPage(QWidget):
     
     def _log_to_console(self, message):
         """Add message to device console"""
-        self.console_output.append(f"[APN] {message}")
+        self.console_output.appendPlainText(f"[APN] {message}")
         
         # Auto-scroll to bottom
         scrollbar = self.console_output.verticalScrollBar()
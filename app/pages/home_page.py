@@ -1,5 +1,7 @@
 import os
 import sys
+import time
+from html import escape
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QListWidget, QScrollArea, QSpacerItem, QSizePolicy
 from PyQt6.QtCore import QUrl, Qt
 from PyQt6.QtWebEngineWidgets import QWebEngineView
@@ -16,10 +18,14 @@ else:
 
 cesium_path = os.path.join(base_path, 'assets', 'cesium.html')
 
+MAX_ACTIVITY_ITEMS = 50
+
 class HomePage(QWidget):
     def __init__(self, config=None):
         super().__init__()
         self.config = config
+        self._markers = {}  # short_id -> last script pushed to the map
+        self._map_ready = False
         self._setup_ui()
         
     def _setup_ui(self):
@@ -77,16 +83,24 @@ class HomePage(QWidget):
     def _setup_metrics(self):
         """Setup the metrics grid"""
         # Add key metrics for APN node contribution
-        self.network_contribution_metric = self.metrics_grid.add_metric("Network Contribution", "0", "APN tokens", "Start earning", 0, 0)
-        self.bandwidth_shared_metric = self.metrics_grid.add_metric("Bandwidth Shared", "0", "GB", "Contribute to earn", 0, 1)
-        self.compute_contributed_metric = self.metrics_grid.add_metric("Compute Shared", "0", "hours", "Idle resources", 0, 2)
-        self.storage_contributed_metric = self.metrics_grid.add_metric("Storage Shared", "0", "GB", "Available space", 0, 3)
+        (
+            self.network_contribution_metric,
+            self.bandwidth_shared_metric,
+            self.compute_contributed_metric,
+            self.storage_contributed_metric,
+        ) = self.metrics_grid.add_metrics_bulk([
+            ("Network Contribution", "0", "APN tokens", "Start earning", 0, 0),
+            ("Bandwidth Shared", "0", "GB", "Contribute to earn", 0, 1),
+            ("Compute Shared", "0", "hours", "Idle resources", 0, 2),
+            ("Storage Shared", "0", "GB", "Available space", 0, 3),
+        ])
         
     def _create_network_map_card(self):
         """Create the network map card"""
         # Web view for Cesium map
         self.web = QWebEngineView()
         self.web.settings().setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
+        self.web.loadFinished.connect(self._on_map_loaded)
         self.web.load(QUrl.fromLocalFile(cesium_path))
         self.web.setMinimumHeight(400)
         
@@ -123,31 +137,21 @@ class HomePage(QWidget):
             ("Peers", "8 connected")
         ]
         
-        for label, value in details:
-            row = QHBoxLayout()
-            
-            label_widget = QLabel(f"{label}:")
-            label_widget.setStyleSheet(f"""
-                QLabel {{ 
-                    color: {APNTheme.COLORS['text_secondary']};
-                    font-weight: 500;
-                    min-width: 100px;
-                }}
-            """)
-            
-            value_widget = QLabel(value)
-            value_widget.setStyleSheet(f"""
-                QLabel {{ 
-                    color: {APNTheme.COLORS['text_primary']};
-                    font-family: 'Courier New', monospace;
-                    font-size: 12px;
-                }}
-            """)
-            
-            row.addWidget(label_widget)
-            row.addWidget(value_widget)
-            row.addStretch()
-            status_layout.addLayout(row)
+        # The details never change, so render them into one rich-text label
+        # rather than a label pair per row
+        rows = "".join(
+            f"<tr>"
+            f"<td style=\"color: {APNTheme.COLORS['text_secondary']}; font-weight: 500; "
+            f"padding: 4px 16px 4px 0px;\" width=\"100\">{escape(label)}:</td>"
+            f"<td style=\"color: {APNTheme.COLORS['text_primary']}; "
+            f"font-family: 'Courier New', monospace; font-size: 12px; padding: 4px 0px;\">"
+            f"{escape(value)}</td>"
+            f"</tr>"
+            for label, value in details
+        )
+        details_label = QLabel(f"<table cellspacing=\"0\">{rows}</table>")
+        details_label.setTextFormat(Qt.TextFormat.RichText)
+        status_layout.addWidget(details_label)
         
         status_layout.addStretch()
         
@@ -198,13 +202,19 @@ class HomePage(QWidget):
         activity_card = GlassCard("Recent Activity", activity_widget)
         return activity_card
 
+    def _on_map_loaded(self, ok):
+        """Replay cached markers; scripts sent before Cesium was ready were dropped"""
+        self._map_ready = ok
+        if ok:
+            for js in self._markers.values():
+                self.web.page().runJavaScript(js)
+        
     def update_nodes(self, nodes):
         """Update the dashboard with node data from Meshtastic"""
         # Calculate more accurate online/offline counts
         total = len(nodes)
         
         # Count actually active nodes (heard from recently)
-        import time
         current_time = time.time()
         recently_active = 0
         local_nodes = 0
@@ -243,6 +253,10 @@ class HomePage(QWidget):
                 self.activity_list.addItem(f"📡 Connected to mesh: {recently_active} active nodes ({local_nodes} local)")
             else:
                 self.activity_list.addItem("📡 Mesh network connected (scanning for active nodes...)")
+            # Drop the oldest entries in one model call
+            excess = self.activity_list.count() - MAX_ACTIVITY_ITEMS
+            if excess > 0:
+                self.activity_list.model().removeRows(0, excess)
             
         # Update map with node positions (only show recently active nodes)
         if hasattr(self, 'web'):
@@ -262,7 +276,11 @@ class HomePage(QWidget):
                         lon = pos.get("longitude")
                         if lat is not None and lon is not None:
                             js = f"addOrUpdateNode('{short_id}', {lat}, {lon}, '{name}');"
-                            self.web.page().runJavaScript(js)
+                            # Skip the JS round-trip when the marker has not moved
+                            if self._markers.get(short_id) != js:
+                                self._markers[short_id] = js
+                                if self._map_ready:
+                                    self.web.page().runJavaScript(js)
                             mapped_nodes += 1
             
             print(f"🗺️ Mapped {mapped_nodes} active nodes with GPS coordinates")
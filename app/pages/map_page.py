@@ -8,6 +8,9 @@ class MapPage(QWidget):
     def __init__(self, config=None):
         super().__init__()
         self.config = config
+        self._pending_nodes = None
+        self._markers = {}  # short_id -> last script pushed to the map
+        self._map_ready = False
         layout = QVBoxLayout()
         self.setLayout(layout)
 
@@ -16,10 +19,31 @@ class MapPage(QWidget):
         self.web = QWebEngineView()
         self.web.settings().setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
         map_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../assets/cesium.html'))
+        self.web.loadFinished.connect(self._on_map_loaded)
         self.web.load(QUrl.fromLocalFile(map_path))
         layout.addWidget(self.web)
 
+    def _on_map_loaded(self, ok):
+        # Scripts sent before Cesium was ready were dropped; replay every marker
+        self._map_ready = ok
+        if ok:
+            for js in self._markers.values():
+                self.web.page().runJavaScript(js)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_nodes is not None:
+            nodes, self._pending_nodes = self._pending_nodes, None
+            self._apply_nodes(nodes)
+
     def update_nodes(self, nodes):
+        # Defer map updates while the page is off-screen; showEvent flushes them
+        if not self.isVisible():
+            self._pending_nodes = nodes
+            return
+        self._apply_nodes(nodes)
+
+    def _apply_nodes(self, nodes):
         for node_id, info in nodes.items():
             user = info.get("user", {})
             name = user.get("longName", "(no name)")
@@ -30,4 +54,8 @@ class MapPage(QWidget):
                 if lat is not None and lon is not None:
                     short_id = node_id.replace("^", "")
                     js = f"addOrUpdateNode('{short_id}', {lat}, {lon}, '{name}');"
-                    self.web.page().runJavaScript(js)
+                    # Skip the JS round-trip when the marker has not moved
+                    if self._markers.get(short_id) != js:
+                        self._markers[short_id] = js
+                        if self._map_ready:
+                            self.web.page().runJavaScript(js)
@@ -1,11 +1,13 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QListWidget, QLabel
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QListView, QLabel
 from app.widgets.network_summary import NetworkSummary
 from app.widgets.block_tracker import BlockTracker
+from app.widgets.node_list_model import NodeListModel
 
 class NodesPage(QWidget):
     def __init__(self, config=None):
         super().__init__()
         self.config = config
+        self._pending_nodes = None
         layout = QVBoxLayout()
         self.setLayout(layout)
 
@@ -18,20 +20,30 @@ class NodesPage(QWidget):
         layout.addWidget(self.blocks)
 
         layout.addWidget(QLabel("Connected Nodes"))
-        self.list = QListWidget()
+        self.node_model = NodeListModel(self)
+        self.list = QListView()
+        self.list.setProperty("class", "item-list")
+        self.list.setUniformItemSizes(True)
+        self.list.setModel(self.node_model)
         layout.addWidget(self.list)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_nodes is not None:
+            nodes, self._pending_nodes = self._pending_nodes, None
+            self._apply_nodes(nodes)
+
     def update_nodes(self, nodes):
+        # Defer the refresh while the page is off-screen; showEvent flushes it
+        if not self.isVisible():
+            self._pending_nodes = nodes
+            return
+        self._apply_nodes(nodes)
+
+    def _apply_nodes(self, nodes):
         total = len(nodes)
         online = sum(1 for n in nodes.values() if n.get("online", True))
         offline = total - online
         self.summary.update(total, online, offline)
 
-        self.list.clear()
-        for node_id, info in nodes.items():
-            user = info.get("user", {})
-            name = user.get("longName", "(no name)")
-            short_id = node_id.replace("^", "")
-            is_online = info.get("online", True)
-            status = "Online" if is_online else "Offline"
-            self.list.addItem(f"{name} [{short_id}] - {status}")
+        self.node_model.set_nodes(nodes)
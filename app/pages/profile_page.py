@@ -2,12 +2,13 @@ import os
 import json
 from pathlib import Path
 from app.pages import globals
+from app.widgets.device_list_model import DeviceListModel
 
 # Simplified profile without Bitcoin dependencies for now
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox,
-    QComboBox, QListWidget, QHBoxLayout, QListWidgetItem, QInputDialog, QDialog,
+    QComboBox, QListView, QHBoxLayout, QInputDialog, QDialog,
     QFormLayout, QTextEdit
 )
 from PyQt6.QtGui import QPixmap
@@ -22,7 +23,7 @@ class ProfilePage(QWidget):
     def copy_apn_url_to_clipboard(self):
         url = globals.PUBLIC_WEB_URL
         if url != "":
-            QGuiApplication.clipboard().setText(url)
+            self._clipboard.setText(url)
             QMessageBox.information(self, "Copied!", f"URL copied to clipboard:\n{url}")
         else:
             QMessageBox.warning(self, "Not Ready", "APN URL is not yet available.")
@@ -30,6 +31,8 @@ class ProfilePage(QWidget):
     def __init__(self, config=None):
         super().__init__()
         self.config = config
+        # Process-wide singleton, look it up once
+        self._clipboard = QGuiApplication.clipboard()
 
         self.devices = []
 
@@ -73,7 +76,11 @@ class ProfilePage(QWidget):
         devices_title.setStyleSheet("font-size: 16px; font-weight: bold;")
         self.layout.addWidget(devices_title)
 
-        self.device_list = QListWidget()
+        self.device_model = DeviceListModel(self)
+        self.device_list = QListView()
+        self.device_list.setProperty("class", "item-list")
+        self.device_list.setUniformItemSizes(True)
+        self.device_list.setModel(self.device_model)
         self.layout.addWidget(self.device_list)
 
         device_buttons = QHBoxLayout()
@@ -143,12 +150,8 @@ class ProfilePage(QWidget):
     # QR code generation removed for now
 
     def refresh_device_list(self):
-        self.device_list.clear()
-        for device in self.devices:
-            item_text = f"{device.get('nickname', '(Unnamed)')} | {device.get('role', 'Unknown')}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, device)
-            self.device_list.addItem(item)
+        # A single model reset; no per-device QListWidgetItem
+        self.device_model.set_devices(self.devices)
 
     def add_device(self):
         device = self.prompt_device_dialog()
@@ -158,33 +161,32 @@ class ProfilePage(QWidget):
             self.save_profile()
 
     def edit_selected_device(self):
-        item = self.device_list.currentItem()
-        if not item:
+        index = self.device_list.currentIndex()
+        if not index.isValid():
             self.show_message("Error", "No device selected.")
             return
 
-        device = item.data(Qt.ItemDataRole.UserRole)
+        device = index.data(Qt.ItemDataRole.UserRole)
         updated_device = self.prompt_device_dialog(device)
         if updated_device:
-            idx = self.devices.index(device)
-            self.devices[idx] = updated_device
+            self.devices[index.row()] = updated_device
             self.refresh_device_list()
             self.save_profile()
 
     def delete_selected_device(self):
-        item = self.device_list.currentItem()
-        if not item:
+        index = self.device_list.currentIndex()
+        if not index.isValid():
             self.show_message("Error", "No device selected.")
             return
 
-        device = item.data(Qt.ItemDataRole.UserRole)
+        device = index.data(Qt.ItemDataRole.UserRole)
         confirm = QMessageBox.question(
             self, "Confirm Delete",
             f"Are you sure you want to delete device '{device.get('nickname', '(Unnamed)')}'?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if confirm == QMessageBox.StandardButton.Yes:
-            self.devices.remove(device)
+            del self.devices[index.row()]
             self.refresh_device_list()
             self.save_profile()
 
@@ -1,16 +1,28 @@
 import json
+import os
 from pathlib import Path
 from typing import List
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to the stdlib json module
+    orjson = None
+
+ResponseClass = ORJSONResponse if orjson else JSONResponse
+
 # -----------------------------
 # SETUP
 # -----------------------------
-app = FastAPI(title="Alpha Protocol Network Registry")
+app = FastAPI(
+    title="Alpha Protocol Network Registry",
+    default_response_class=ResponseClass,
+)
 
 APN_DIR = Path.home() / ".apn"
 NODE_CONFIG_PATH = APN_DIR / "node_config.json"
@@ -18,6 +30,8 @@ REGISTRY_PATH = APN_DIR / "registry.json"
 
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+# Templates ship with the app; keep compiled templates instead of stat-ing on every render
+templates.env.auto_reload = False
 
 
 # -----------------------------
@@ -33,24 +47,72 @@ class NodeConfig(BaseModel):
 # -----------------------------
 # Helper Functions
 # -----------------------------
+# Parsed JSON files, re-read only when the file's mtime changes
+_config_cache = {"mtime": None, "data": None}
+_registry_cache = {"mtime": None, "data": [], "ids": set()}
+
+
+def _read_json(path: Path):
+    if orjson:
+        return orjson.loads(path.read_bytes())
+    with path.open() as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data):
+    if orjson:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with path.open("w") as f:
+            json.dump(data, f, indent=2)
+
+
+def _file_mtime(path: Path):
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def load_own_config() -> dict:
-    if NODE_CONFIG_PATH.exists():
-        with NODE_CONFIG_PATH.open() as f:
-            return json.load(f)
-    raise HTTPException(status_code=404, detail="Node config not found.")
+    mtime = _file_mtime(NODE_CONFIG_PATH)
+    if mtime is None:
+        raise HTTPException(status_code=404, detail="Node config not found.")
+    if mtime != _config_cache["mtime"]:
+        _config_cache.update(mtime=mtime, data=_read_json(NODE_CONFIG_PATH))
+    return _config_cache["data"]
+
+
+def _set_registry_cache(mtime, registry: List[dict]):
+    _registry_cache.update(
+        mtime=mtime,
+        data=registry,
+        ids={node.get("nodeId") for node in registry},
+    )
 
 
 def load_registry() -> List[dict]:
-    if REGISTRY_PATH.exists():
-        with REGISTRY_PATH.open() as f:
-            return json.load(f)
-    return []
+    mtime = _file_mtime(REGISTRY_PATH)
+    if mtime is None:
+        if _registry_cache["mtime"] is not None:
+            _set_registry_cache(None, [])
+        return []
+    if mtime != _registry_cache["mtime"]:
+        _set_registry_cache(mtime, _read_json(REGISTRY_PATH))
+    return _registry_cache["data"]
+
+
+def registry_node_ids() -> set:
+    """nodeIds in the registry as of the last load_registry() call"""
+    return _registry_cache["ids"]
 
 
 def save_registry(registry: List[dict]):
     APN_DIR.mkdir(parents=True, exist_ok=True)
-    with REGISTRY_PATH.open("w") as f:
-        json.dump(registry, f, indent=2)
+    tmp_path = REGISTRY_PATH.with_suffix(".tmp")
+    _write_json(tmp_path, registry)
+    os.replace(tmp_path, REGISTRY_PATH)
+    _set_registry_cache(_file_mtime(REGISTRY_PATH), registry)
 
 
 # -----------------------------
@@ -76,16 +138,17 @@ def get_own_config():
     return load_own_config()
 
 
-@app.get("/registry", response_model=List[NodeConfig])
+@app.get("/registry")
 def get_registry():
     registry = load_registry()
     own = load_own_config()
 
-    # Ensure own config is always included
-    if not any(node.get("nodeId") == own.get("nodeId") for node in registry):
-        registry.insert(0, own)
+    # Ensure own config is always included (copy so the cache is untouched)
+    if own.get("nodeId") not in registry_node_ids():
+        registry = [own] + registry
 
-    return registry
+    # Already plain JSON data; skip re-validating every entry against NodeConfig
+    return ResponseClass(registry)
 
 
 @app.post("/register")
@@ -93,11 +156,9 @@ def register_peer(peer: NodeConfig):
     registry = load_registry()
 
     # Check for duplicates by nodeId
-    for existing in registry:
-        if existing.get("nodeId") == peer.nodeId:
-            raise HTTPException(status_code=400, detail="Node already registered.")
+    if peer.nodeId in registry_node_ids():
+        raise HTTPException(status_code=400, detail="Node already registered.")
 
-    registry.append(peer.dict())
-    save_registry(registry)
+    save_registry(registry + [peer.model_dump()])
 
     return {"message": f"Node '{peer.nodeId}' registered successfully."}
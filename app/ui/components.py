@@ -8,14 +8,21 @@ from PyQt6.QtWidgets import (
     QGridLayout, QSpacerItem, QSizePolicy, QGraphicsDropShadowEffect
 )
 from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt6.QtGui import QColor, QPalette, QFont
+from PyQt6.QtGui import QPalette, QFont
 from .theme import APNTheme
 
 
+def _repolish(widget):
+    """Re-apply the application stylesheet after a dynamic property change"""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
 class GlowEffect(QGraphicsDropShadowEffect):
     """Custom glow effect for holographic UI elements"""
     
-    def __init__(self, color=QColor(255, 215, 0, 77), blur_radius=20):
+    def __init__(self, color=APNTheme.GLOW_QCOLOR, blur_radius=20):
         super().__init__()
         self.setColor(color)
         self.setBlurRadius(blur_radius)
@@ -25,6 +32,9 @@ class GlowEffect(QGraphicsDropShadowEffect):
 class HolographicButton(QPushButton):
     """Modern holographic button with glow effects"""
     
+    # Shared by every button; created on first use since QFont needs a QApplication
+    _FONT = None
+    
     def __init__(self, text="", variant="default", parent=None):
         super().__init__(text, parent)
         self.variant = variant
@@ -33,29 +43,47 @@ class HolographicButton(QPushButton):
         
     def _setup_style(self):
         """Apply holographic styling"""
-        if self.variant == "primary":
-            self.setStyleSheet(APNTheme.get_holographic_button_style("primary"))
-        elif self.variant == "secondary":
-            self.setStyleSheet(APNTheme.get_holographic_button_style("secondary"))
+        # Styled by HolographicButton[variant=...] in the main stylesheet
+        if self.variant in ("primary", "secondary"):
+            self.setProperty("variant", self.variant)
         else:
-            self.setStyleSheet(APNTheme.get_holographic_button_style("ghost"))
+            self.setProperty("variant", "ghost")
             
         # Set font
-        font = QFont("SF Pro Display", 14, QFont.Weight.Bold)
-        self.setFont(font)
+        if HolographicButton._FONT is None:
+            HolographicButton._FONT = QFont("SF Pro Display", 14, QFont.Weight.Bold)
+        self.setFont(HolographicButton._FONT)
+        
+    def set_variant(self, variant):
+        """Switch variant via the dynamic property, reusing the parsed stylesheet"""
+        if variant == self.variant:
+            return
+        self.variant = variant
+        self._setup_style()
+        _repolish(self)
+        self.setGraphicsEffect(None)
+        self._setup_effects()
         
     def _setup_effects(self):
         """Add glow and shadow effects"""
-        if self.variant == "primary":
-            glow = GlowEffect(QColor(255, 215, 0, 100), 25)
+        if self.variant == "primary" and APNTheme.ENABLE_SHADOWS:
+            glow = GlowEffect(APNTheme.GLOW_PRIMARY_QCOLOR, 25)
             self.setGraphicsEffect(glow)
 
 
 class GlassCard(QFrame):
     """Glass-morphism style card component"""
     
+    # Subclasses that create their own content call _build() themselves
+    BUILD_IN_INIT = True
+    
     def __init__(self, title="", content_widget=None, parent=None):
         super().__init__(parent)
+        if self.BUILD_IN_INIT:
+            self._build(title, content_widget)
+        
+    def _build(self, title, content_widget):
+        """Lay out title and content and apply the style"""
         self.title = title
         self.content_widget = content_widget
         self._setup_ui()
@@ -80,11 +108,13 @@ class GlassCard(QFrame):
             
     def _apply_style(self):
         """Apply glass-morphism styling"""
-        self.setStyleSheet(APNTheme.get_card_style())
+        self.setProperty("class", "glass-card")
         
         # Add subtle shadow
+        if not APNTheme.ENABLE_SHADOWS:
+            return
         shadow = QGraphicsDropShadowEffect()
-        shadow.setColor(QColor(0, 0, 0, 50))
+        shadow.setColor(APNTheme.SHADOW_QCOLOR)
         shadow.setBlurRadius(15)
         shadow.setOffset(0, 4)
         self.setGraphicsEffect(shadow)
@@ -93,153 +123,128 @@ class GlassCard(QFrame):
 class StatusIndicator(QLabel):
     """Status indicator with color-coded states"""
     
+    STATES = frozenset(("online", "offline", "warning", "info"))
+    
     def __init__(self, status="offline", text="", parent=None):
         super().__init__(text, parent)
         self.status = status
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._update_appearance()
         
     def set_status(self, status, text=""):
         """Update the status indicator"""
         self.status = status
-        if text:
+        if text and text != self.text():
             self.setText(text)
         self._update_appearance()
         
     def _update_appearance(self):
         """Update visual appearance based on status"""
-        status_styles = {
-            "online": f"""
-                QLabel {{
-                    background-color: {APNTheme.COLORS['success']};
-                    color: {APNTheme.COLORS['bg_primary']};
-                    border-radius: 12px;
-                    padding: 8px 16px;
-                    font-weight: 600;
-                    font-size: 12px;
-                }}
-            """,
-            "offline": f"""
-                QLabel {{
-                    background-color: {APNTheme.COLORS['error']};
-                    color: white;
-                    border-radius: 12px;
-                    padding: 8px 16px;
-                    font-weight: 600;
-                    font-size: 12px;
-                }}
-            """,
-            "warning": f"""
-                QLabel {{
-                    background-color: {APNTheme.COLORS['warning']};
-                    color: {APNTheme.COLORS['bg_primary']};
-                    border-radius: 12px;
-                    padding: 8px 16px;
-                    font-weight: 600;
-                    font-size: 12px;
-                }}
-            """,
-            "info": f"""
-                QLabel {{
-                    background-color: {APNTheme.COLORS['info']};
-                    color: white;
-                    border-radius: 12px;
-                    padding: 8px 16px;
-                    font-weight: 600;
-                    font-size: 12px;
-                }}
-            """
-        }
-        
-        self.setStyleSheet(status_styles.get(self.status, status_styles["offline"]))
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Styled by StatusIndicator[state=...]; unknown states look like offline
+        state = self.status if self.status in self.STATES else "offline"
+        if self.property("state") == state:
+            return  # Polling often reports the same status; skip the re-polish
+        self.setProperty("state", state)
+        _repolish(self)
 
 
 class MetricCard(GlassCard):
     """Card for displaying metrics with large numbers"""
     
+    BUILD_IN_INIT = False
+    
     def __init__(self, title, value, unit="", trend=None, parent=None):
+        super().__init__(parent=parent)
         self.metric_value = value
         self.unit = unit
         self.trend = trend
         
-        content = self._create_metric_content()
-        super().__init__(title, content, parent)
+        self._build(title, self._create_metric_content())
         
     def _create_metric_content(self):
         """Create the metric display content"""
+        # Main value
+        value_label = QLabel(str(self.metric_value))
+        value_label.setObjectName("metricValue")
+        value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.value_label = value_label
+        self.unit_label = None
+        self.trend_label = None
+        
+        # Value-only cards need no wrapper widget
+        if not self.unit and not self.trend:
+            return value_label
+        
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
-        
-        # Main value
-        value_label = QLabel(str(self.metric_value))
-        value_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 36px;
-                font-weight: 700;
-                color: {APNTheme.COLORS['alpha_gold']};
-                margin: 0px;
-            }}
-        """)
-        value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(value_label)
         
         # Unit
         if self.unit:
             unit_label = QLabel(self.unit)
-            unit_label.setStyleSheet(f"""
-                QLabel {{
-                    font-size: 14px;
-                    font-weight: 500;
-                    color: {APNTheme.COLORS['text_secondary']};
-                    margin: 0px;
-                }}
-            """)
+            unit_label.setObjectName("metricUnit")
             unit_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             layout.addWidget(unit_label)
+            self.unit_label = unit_label
             
         # Trend indicator
         if self.trend:
             trend_label = QLabel(self.trend)
-            trend_color = APNTheme.COLORS['success'] if self.trend.startswith('↑') else APNTheme.COLORS['error']
-            trend_label.setStyleSheet(f"""
-                QLabel {{
-                    font-size: 12px;
-                    font-weight: 600;
-                    color: {trend_color};
-                    margin-top: 8px;
-                }}
-            """)
+            trend_label.setObjectName("metricTrend")
+            trend_label.setProperty("trend", self._trend_direction(self.trend))
             trend_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             layout.addWidget(trend_label)
+            self.trend_label = trend_label
         
         return widget
     
+    @staticmethod
+    def _trend_direction(trend):
+        return "up" if trend.startswith('↑') else "down"
+    
     def update_metric(self, value, unit="", trend=None):
         """Update the metric values"""
-        self.metric_value = value
-        self.unit = unit
-        self.trend = trend
-        
-        # Find and update the value label
-        for child in self.content_widget.findChildren(QLabel):
-            if child.text() == str(self.metric_value):
-                child.setText(str(value))
-                break
+        # Only touch labels whose text changed; setText re-lays out the card
+        if value != self.metric_value:
+            self.metric_value = value
+            self.value_label.setText(str(value))
+            
+        if unit != self.unit:
+            self.unit = unit
+            if self.unit_label is not None:
+                self.unit_label.setText(unit)
+                
+        if trend != self.trend:
+            self.trend = trend
+            if self.trend_label is not None:
+                if trend:
+                    self.trend_label.setText(trend)
+                    self.trend_label.show()
+                    direction = self._trend_direction(trend)
+                    if self.trend_label.property("trend") != direction:
+                        self.trend_label.setProperty("trend", direction)
+                        _repolish(self.trend_label)
+                else:
+                    # No trend any more; don't leave the old one on screen
+                    self.trend_label.clear()
+                    self.trend_label.hide()
 
 
 class NodeCard(GlassCard):
     """Card for displaying node information"""
     
+    BUILD_IN_INIT = False
+    
     def __init__(self, node_id, node_name, status="offline", details=None, parent=None):
+        super().__init__(parent=parent)
         self.node_id = node_id
         self.node_name = node_name
         self.node_status = status
         self.details = details or {}
         
-        content = self._create_node_content()
-        super().__init__(f"Node: {node_name}", content, parent)
+        self._build(f"Node: {node_name}", self._create_node_content())
         
     def _create_node_content(self):
         """Create node information content"""
@@ -257,44 +262,29 @@ class NodeCard(GlassCard):
         
         # Node ID
         id_label = QLabel(f"ID: {self.node_id}")
-        id_label.setStyleSheet(f"""
-            QLabel {{
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-                color: {APNTheme.COLORS['text_secondary']};
-            }}
-        """)
+        id_label.setObjectName("nodeId")
         status_row.addWidget(id_label)
         status_row.addStretch()
         
         layout.addLayout(status_row)
         
-        # Details
+        # Details (one grid for all rows; column 2 takes the slack)
         if self.details:
-            for key, value in self.details.items():
-                detail_row = QHBoxLayout()
-                
+            details_grid = QGridLayout()
+            details_grid.setHorizontalSpacing(12)
+            details_grid.setVerticalSpacing(12)
+            for row, (key, value) in enumerate(self.details.items()):
                 key_label = QLabel(f"{key}:")
-                key_label.setStyleSheet(f"""
-                    QLabel {{
-                        font-weight: 500;
-                        color: {APNTheme.COLORS['text_secondary']};
-                        min-width: 80px;
-                    }}
-                """)
+                key_label.setObjectName("nodeDetailKey")
                 
                 value_label = QLabel(str(value))
-                value_label.setStyleSheet(f"""
-                    QLabel {{
-                        color: {APNTheme.COLORS['text_primary']};
-                    }}
-                """)
+                value_label.setObjectName("nodeDetailValue")
                 
-                detail_row.addWidget(key_label)
-                detail_row.addWidget(value_label)
-                detail_row.addStretch()
-                
-                layout.addLayout(detail_row)
+                details_grid.addWidget(key_label, row, 0)
+                details_grid.addWidget(value_label, row, 1)
+            details_grid.setColumnStretch(2, 1)
+            
+            layout.addLayout(details_grid)
         
         return widget
 
@@ -315,20 +305,7 @@ class HolographicHeader(QWidget):
         
         # Logo (Alpha symbol)
         logo = QLabel("Α")
-        logo.setStyleSheet(f"""
-            QLabel {{
-                font-size: 48px;
-                font-weight: 700;
-                color: {APNTheme.COLORS['alpha_gold']};
-                border: 2px solid {APNTheme.COLORS['alpha_gold']};
-                border-radius: 12px;
-                padding: 16px;
-                min-width: 80px;
-                max-width: 80px;
-                text-align: center;
-                background: {APNTheme.COLORS['glass_primary']};
-            }}
-        """)
+        logo.setObjectName("apnLogo")
         logo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(logo)
         
@@ -338,34 +315,21 @@ class HolographicHeader(QWidget):
         
         title_label = QLabel(self.title)
         title_label.setProperty("class", "title")
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 32px;
-                font-weight: 700;
-                color: {APNTheme.COLORS['alpha_gold']};
-                margin: 0px;
-            }}
-        """)
+        title_label.setObjectName("apnTitle")
         text_layout.addWidget(title_label)
         
         if self.subtitle:
             subtitle_label = QLabel(self.subtitle)
-            subtitle_label.setStyleSheet(f"""
-                QLabel {{
-                    font-size: 16px;
-                    font-weight: 400;
-                    color: {APNTheme.COLORS['text_secondary']};
-                    margin: 0px;
-                }}
-            """)
+            subtitle_label.setObjectName("apnSubtitle")
             text_layout.addWidget(subtitle_label)
             
         layout.addLayout(text_layout)
         layout.addStretch()
         
         # Add glow effect
-        glow = GlowEffect(QColor(255, 215, 0, 50), 30)
-        self.setGraphicsEffect(glow)
+        if APNTheme.ENABLE_SHADOWS:
+            glow = GlowEffect(APNTheme.GLOW_HEADER_QCOLOR, 30)
+            self.setGraphicsEffect(glow)
 
 
 class MetricsGrid(QWidget):
@@ -383,6 +347,15 @@ class MetricsGrid(QWidget):
         self.grid_layout.addWidget(metric_card, row, col)
         return metric_card
     
+    def add_metrics_bulk(self, specs):
+        """Add (title, value, unit, trend, row, col) metric cards; returns them in order"""
+        cards = []
+        for title, value, unit, trend, row, col in specs:
+            metric_card = MetricCard(title, value, unit, trend)
+            self.grid_layout.addWidget(metric_card, row, col)
+            cards.append(metric_card)
+        return cards
+    
     def add_custom_widget(self, widget, row=0, col=0, row_span=1, col_span=1):
         """Add a custom widget to the grid"""
         self.grid_layout.addWidget(widget, row, col, row_span, col_span)
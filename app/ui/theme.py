@@ -1,12 +1,34 @@
 """
 Alpha Protocol Network - Modern Dark Theme with Holographic Effects
 """
+import re
+from functools import lru_cache, wraps
+from types import MappingProxyType
+
+from PyQt6.QtGui import QColor, QPalette
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WHITESPACE = re.compile(r"\s+")
+
+
+def _minified(builder):
+    """Strip comments and collapse whitespace in a stylesheet builder's output"""
+    @wraps(builder)
+    def build(*args, **kwargs):
+        css = _CSS_COMMENT.sub("", builder(*args, **kwargs))
+        return _CSS_WHITESPACE.sub(" ", css).strip()
+    return build
+
 
 class APNTheme:
     """Modern dark theme with holographic effects for APN Dashboard"""
     
-    # Color Palette
-    COLORS = {
+    # QGraphicsEffect shadows/glows render each widget offscreen and blur it
+    # on every repaint; the stylesheet borders and gradients carry the look
+    ENABLE_SHADOWS = False
+    
+    # Color Palette (read-only, so the cached stylesheets below stay valid)
+    COLORS = MappingProxyType({
         # Primary colors
         'alpha_gold': '#FFD700',
         'alpha_gold_hover': '#FFED4A',
@@ -41,9 +63,41 @@ class APNTheme:
         'glow_secondary': 'rgba(255, 215, 0, 0.1)',
         'glass_primary': 'rgba(255, 255, 255, 0.05)',
         'glass_secondary': 'rgba(255, 255, 255, 0.02)',
-    }
+    })
+    
+    # Palette roles the stylesheet refers to as palette(...)
+    PALETTE_ROLES = MappingProxyType({
+        QPalette.ColorRole.Window: 'bg_primary',
+        QPalette.ColorRole.WindowText: 'text_primary',
+        QPalette.ColorRole.Base: 'bg_elevated',
+        QPalette.ColorRole.AlternateBase: 'bg_card',
+        QPalette.ColorRole.Text: 'text_primary',
+        QPalette.ColorRole.PlaceholderText: 'text_muted',
+        QPalette.ColorRole.Button: 'bg_tertiary',
+        QPalette.ColorRole.ButtonText: 'text_primary',
+        QPalette.ColorRole.Highlight: 'alpha_gold',
+        QPalette.ColorRole.HighlightedText: 'bg_primary',
+        QPalette.ColorRole.ToolTipBase: 'bg_card',
+        QPalette.ColorRole.ToolTipText: 'text_primary',
+    })
+    
+    @classmethod
+    def get_palette(cls, base=None):
+        """Get a QPalette carrying the theme's base colors"""
+        palette = QPalette(base) if base is not None else QPalette()
+        for role, color_name in cls.PALETTE_ROLES.items():
+            palette.setColor(role, cls.QCOLORS[color_name])
+        return palette
     
     @classmethod
+    def apply(cls, app):
+        """Apply the palette and main stylesheet to the application"""
+        app.setPalette(cls.get_palette(app.palette()))
+        app.setStyleSheet(cls.get_main_stylesheet())
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    @_minified
     def get_main_stylesheet(cls):
         """Get the main application stylesheet"""
         return f"""
@@ -54,7 +108,7 @@ class APNTheme:
                 stop: 0 {cls.COLORS['bg_primary']},
                 stop: 1 {cls.COLORS['bg_secondary']}
             );
-            color: {cls.COLORS['text_primary']};
+            color: palette(window-text);
             font-family: 'SF Pro Display', 'Segoe UI', 'Roboto', sans-serif;
             font-size: 14px;
             font-weight: 400;
@@ -84,14 +138,14 @@ class APNTheme:
         }}
         
         /* Navigation List */
-        QListWidget {{
+        QListWidget, QListView[class="item-list"] {{
             background: transparent;
             border: none;
             outline: none;
             padding: 8px;
         }}
         
-        QListWidget::item {{
+        QListWidget::item, QListView[class="item-list"]::item {{
             background: {cls.COLORS['glass_primary']};
             border: 1px solid {cls.COLORS['border_primary']};
             border-radius: 8px;
@@ -103,13 +157,13 @@ class APNTheme:
             transition: all 0.3s ease;
         }}
         
-        QListWidget::item:hover {{
+        QListWidget::item:hover, QListView[class="item-list"]::item:hover {{
             background: {cls.COLORS['glass_primary']};
             border: 1px solid {cls.COLORS['border_hover']};
             color: {cls.COLORS['text_primary']};
         }}
         
-        QListWidget::item:selected {{
+        QListWidget::item:selected, QListView[class="item-list"]::item:selected {{
             background: qlineargradient(
                 x1: 0, y1: 0, x2: 1, y2: 0,
                 stop: 0 {cls.COLORS['glow_primary']},
@@ -178,29 +232,29 @@ class APNTheme:
             );
             border: 1px solid {cls.COLORS['border_primary']};
             border-radius: 16px;
-            padding: 20px;
+            padding: 24px;
             margin: 8px;
         }}
         
         /* Input Fields */
-        QLineEdit, QTextEdit, QComboBox {{
+        QLineEdit, QTextEdit, QPlainTextEdit, QComboBox {{
             background: {cls.COLORS['bg_elevated']};
             border: 1px solid {cls.COLORS['border_primary']};
             border-radius: 8px;
             padding: 12px;
             font-size: 14px;
-            color: {cls.COLORS['text_primary']};
-            selection-background-color: {cls.COLORS['alpha_gold']};
-            selection-color: {cls.COLORS['bg_primary']};
+            color: palette(text);
+            selection-background-color: palette(highlight);
+            selection-color: palette(highlighted-text);
         }}
         
-        QLineEdit:focus, QTextEdit:focus, QComboBox:focus {{
+        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QComboBox:focus {{
             border: 2px solid {cls.COLORS['alpha_gold']};
         }}
         
         /* Labels */
         QLabel {{
-            color: {cls.COLORS['text_primary']};
+            color: palette(window-text);
             font-size: 14px;
         }}
         
@@ -260,7 +314,7 @@ class APNTheme:
         
         /* Checkboxes */
         QCheckBox {{
-            color: {cls.COLORS['text_primary']};
+            color: palette(window-text);
             font-size: 14px;
             spacing: 8px;
         }}
@@ -329,77 +383,169 @@ class APNTheme:
             background: {cls.COLORS['warning']};
             color: {cls.COLORS['bg_primary']};
         }}
+        
+        /* Holographic Buttons (components.HolographicButton) */
+        HolographicButton[variant="primary"] {{
+            background: qlineargradient(
+                x1: 0, y1: 0, x2: 1, y2: 1,
+                stop: 0 {cls.COLORS['alpha_gold']},
+                stop: 0.5 {cls.COLORS['alpha_gold_hover']},
+                stop: 1 {cls.COLORS['alpha_gold']}
+            );
+            border: 2px solid {cls.COLORS['alpha_gold']};
+            border-radius: 12px;
+            padding: 16px 32px;
+            font-size: 16px;
+            font-weight: 700;
+            color: {cls.COLORS['bg_primary']};
+        }}
+        
+        HolographicButton[variant="primary"]:hover {{
+            background: {cls.COLORS['alpha_gold_hover']};
+            border: 2px solid {cls.COLORS['alpha_gold']};
+            color: {cls.COLORS['bg_primary']};
+        }}
+        
+        HolographicButton[variant="secondary"] {{
+            background: transparent;
+            border: 2px solid {cls.COLORS['alpha_gold']};
+            border-radius: 12px;
+            padding: 16px 32px;
+            font-size: 16px;
+            font-weight: 600;
+            color: {cls.COLORS['alpha_gold']};
+        }}
+        
+        HolographicButton[variant="secondary"]:hover {{
+            background: {cls.COLORS['glass_primary']};
+            border: 2px solid {cls.COLORS['alpha_gold']};
+            color: {cls.COLORS['alpha_gold']};
+        }}
+        
+        HolographicButton[variant="ghost"] {{
+            background: {cls.COLORS['glass_secondary']};
+            border: 1px solid {cls.COLORS['border_primary']};
+            border-radius: 8px;
+            padding: 12px 24px;
+            font-size: 14px;
+            font-weight: 500;
+            color: {cls.COLORS['text_primary']};
+        }}
+        
+        HolographicButton[variant="ghost"]:hover {{
+            background: {cls.COLORS['glass_primary']};
+            border: 1px solid {cls.COLORS['alpha_gold']};
+            color: {cls.COLORS['alpha_gold']};
+        }}
+        
+        /* Status Indicator (components.StatusIndicator) */
+        StatusIndicator {{
+            border-radius: 12px;
+            padding: 8px 16px;
+            font-weight: 600;
+            font-size: 12px;
+        }}
+        
+        StatusIndicator[state="online"] {{
+            background-color: {cls.COLORS['success']};
+            color: {cls.COLORS['bg_primary']};
+        }}
+        
+        StatusIndicator[state="offline"] {{
+            background-color: {cls.COLORS['error']};
+            color: white;
+        }}
+        
+        StatusIndicator[state="warning"] {{
+            background-color: {cls.COLORS['warning']};
+            color: {cls.COLORS['bg_primary']};
+        }}
+        
+        StatusIndicator[state="info"] {{
+            background-color: {cls.COLORS['info']};
+            color: white;
+        }}
+        
+        /* Metric Cards */
+        QLabel#metricValue {{
+            font-size: 36px;
+            font-weight: 700;
+            color: {cls.COLORS['alpha_gold']};
+            margin: 0px;
+        }}
+        
+        QLabel#metricUnit {{
+            font-size: 14px;
+            font-weight: 500;
+            color: {cls.COLORS['text_secondary']};
+            margin: 0px;
+        }}
+        
+        QLabel#metricTrend {{
+            font-size: 12px;
+            font-weight: 600;
+            margin-top: 8px;
+        }}
+        
+        QLabel#metricTrend[trend="up"] {{
+            color: {cls.COLORS['success']};
+        }}
+        
+        QLabel#metricTrend[trend="down"] {{
+            color: {cls.COLORS['error']};
+        }}
+        
+        /* Node Cards */
+        QLabel#nodeId {{
+            font-family: 'Courier New', monospace;
+            font-size: 12px;
+            color: {cls.COLORS['text_secondary']};
+        }}
+        
+        QLabel#nodeDetailKey {{
+            font-weight: 500;
+            color: {cls.COLORS['text_secondary']};
+            min-width: 80px;
+        }}
+        
+        QLabel#nodeDetailValue {{
+            color: {cls.COLORS['text_primary']};
+        }}
+        
+        /* Header */
+        QLabel#apnLogo {{
+            font-size: 48px;
+            font-weight: 700;
+            color: {cls.COLORS['alpha_gold']};
+            border: 2px solid {cls.COLORS['alpha_gold']};
+            border-radius: 12px;
+            padding: 16px;
+            min-width: 80px;
+            max-width: 80px;
+            background: {cls.COLORS['glass_primary']};
+        }}
+        
+        QLabel#apnTitle {{
+            font-size: 32px;
+            font-weight: 700;
+            color: {cls.COLORS['alpha_gold']};
+            margin: 0px;
+        }}
+        
+        QLabel#apnSubtitle {{
+            font-size: 16px;
+            font-weight: 400;
+            color: {cls.COLORS['text_secondary']};
+            margin: 0px;
+        }}
         """
-    
-    @classmethod
-    def get_holographic_button_style(cls, variant="default"):
-        """Get specific holographic button styles"""
-        styles = {
-            "primary": f"""
-                QPushButton {{
-                    background: qlineargradient(
-                        x1: 0, y1: 0, x2: 1, y2: 1,
-                        stop: 0 {cls.COLORS['alpha_gold']},
-                        stop: 0.5 {cls.COLORS['alpha_gold_hover']},
-                        stop: 1 {cls.COLORS['alpha_gold']}
-                    );
-                    border: 2px solid {cls.COLORS['alpha_gold']};
-                    border-radius: 12px;
-                    padding: 16px 32px;
-                    font-size: 16px;
-                    font-weight: 700;
-                    color: {cls.COLORS['bg_primary']};
-                }}
-                QPushButton:hover {{
-                    background: {cls.COLORS['alpha_gold_hover']};
-                }}
-            """,
-            "secondary": f"""
-                QPushButton {{
-                    background: transparent;
-                    border: 2px solid {cls.COLORS['alpha_gold']};
-                    border-radius: 12px;
-                    padding: 16px 32px;
-                    font-size: 16px;
-                    font-weight: 600;
-                    color: {cls.COLORS['alpha_gold']};
-                }}
-                QPushButton:hover {{
-                    background: {cls.COLORS['glass_primary']};
-                }}
-            """,
-            "ghost": f"""
-                QPushButton {{
-                    background: {cls.COLORS['glass_secondary']};
-                    border: 1px solid {cls.COLORS['border_primary']};
-                    border-radius: 8px;
-                    padding: 12px 24px;
-                    font-size: 14px;
-                    font-weight: 500;
-                    color: {cls.COLORS['text_primary']};
-                }}
-                QPushButton:hover {{
-                    background: {cls.COLORS['glass_primary']};
-                    border: 1px solid {cls.COLORS['alpha_gold']};
-                    color: {cls.COLORS['alpha_gold']};
-                }}
-            """
-        }
-        return styles.get(variant, styles.get("ghost", ""))
-    
-    @classmethod
-    def get_card_style(cls, variant="default"):
-        """Get glass card styles"""
-        return f"""
-            QWidget {{
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 {cls.COLORS['glass_primary']},
-                    stop: 1 {cls.COLORS['glass_secondary']}
-                );
-                border: 1px solid {cls.COLORS['border_primary']};
-                border-radius: 16px;
-                padding: 24px;
-                margin: 8px;
-            }}
-        """
+
+
+# Parsed once at import for code that paints or sets effects directly
+APNTheme.QCOLORS = MappingProxyType({
+    name: QColor(value) for name, value in APNTheme.COLORS.items() if value.startswith('#')
+})
+APNTheme.GLOW_QCOLOR = QColor(255, 215, 0, 77)
+APNTheme.GLOW_PRIMARY_QCOLOR = QColor(255, 215, 0, 100)
+APNTheme.GLOW_HEADER_QCOLOR = QColor(255, 215, 0, 50)
+APNTheme.SHADOW_QCOLOR = QColor(0, 0, 0, 50)
@@ -1,5 +1,7 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QListWidget
 
+_STATUS_ICONS = {"confirmed": "✅"}
+
 class BlockTracker(QWidget):
     def __init__(self):
         super().__init__()
@@ -21,6 +23,7 @@ class BlockTracker(QWidget):
             {"height": 840003, "status": "upcoming"},
         ]
         self.list.clear()
-        for block in blocks:
-            icon = "✅" if block["status"] == "confirmed" else "🕒"
-            self.list.addItem(f"{icon} Block {block['height']}")
+        self.list.addItems([
+            f"{_STATUS_ICONS.get(block['status'], '🕒')} Block {block['height']}"
+            for block in blocks
+        ])
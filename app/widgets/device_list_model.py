@@ -0,0 +1,39 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class DeviceListModel(QAbstractListModel):
+    """List model over the profile's saved devices.
+
+    Backed by the profile's list of device dicts; the display text for each
+    row is formatted once when the list is set, not on every repaint.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._devices = []
+        self._display = []
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._devices)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display[row]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._devices[row]
+        return None
+
+    def set_devices(self, devices):
+        """Replace the device list (kept by reference, not copied)"""
+        self.beginResetModel()
+        self._devices = devices
+        self._display = [
+            f"{device.get('nickname', '(Unnamed)')} | {device.get('role', 'Unknown')}"
+            for device in devices
+        ]
+        self.endResetModel()
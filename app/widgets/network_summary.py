@@ -1,4 +1,12 @@
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
+from app.ui.theme import APNTheme
+
+_SUMMARY_TEMPLATE = (
+    "Total Nodes: {total}&nbsp;&nbsp;•&nbsp;&nbsp;"
+    f"Online: <b style=\"color: {APNTheme.COLORS['success']}\">{{online}}</b>&nbsp;&nbsp;•&nbsp;&nbsp;"
+    f"Offline: <b style=\"color: {APNTheme.COLORS['error']}\">{{offline}}</b>"
+)
 
 class NetworkSummary(QWidget):
     def __init__(self):
@@ -6,15 +14,20 @@ class NetworkSummary(QWidget):
         layout = QHBoxLayout()
         self.setLayout(layout)
 
-        self.total_label = QLabel("Total Nodes: 0")
-        self.online_label = QLabel("Online: 0")
-        self.offline_label = QLabel("Offline: 0")
+        # One rich-text label: a count change is one setText and one relayout
+        self.summary_label = QLabel()
+        self.summary_label.setTextFormat(Qt.TextFormat.RichText)
+        layout.addWidget(self.summary_label)
 
-        layout.addWidget(self.total_label)
-        layout.addWidget(self.online_label)
-        layout.addWidget(self.offline_label)
+        self._counts = None  # (total, online, offline) currently shown
+        self.update(0, 0, 0)
 
     def update(self, total, online, offline):
-        self.total_label.setText(f"Total Nodes: {total}")
-        self.online_label.setText(f"Online: {online}")
-        self.offline_label.setText(f"Offline: {offline}")
+        # Node polls mostly repeat the same counts
+        counts = (total, online, offline)
+        if counts == self._counts:
+            return
+        self._counts = counts
+        self.summary_label.setText(
+            _SUMMARY_TEMPLATE.format(total=total, online=online, offline=offline)
+        )
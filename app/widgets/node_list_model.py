@@ -0,0 +1,72 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+_STATUS_TEXT = {True: "Online", False: "Offline"}
+
+
+class NodeListModel(QAbstractListModel):
+    """List model over the Meshtastic node table.
+
+    Rows are formatted lazily in data(), so a QListView only pays for the
+    rows it actually paints instead of one QListWidgetItem per node.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._nodes = {}
+        self._ids = []
+        self._display = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._ids)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._format_row(row)
+        if role == Qt.ItemDataRole.UserRole:
+            return self._ids[row]
+        return None
+
+    def set_nodes(self, nodes):
+        """Replace the node table (kept by reference, not copied)"""
+        ids = list(nodes)
+        old_count = len(self._ids)
+        if ids[:old_count] == self._ids:
+            # Common case: same nodes, possibly with new ones heard since
+            self._nodes = nodes
+            if old_count:
+                self.dataChanged.emit(self.index(0), self.index(old_count - 1))
+            if len(ids) > old_count:
+                self.beginInsertRows(QModelIndex(), old_count, len(ids) - 1)
+                self._ids = ids
+                self.endInsertRows()
+            return
+
+        self.beginResetModel()
+        self._nodes = nodes
+        self._ids = ids
+        # Keep formatted rows for nodes that are still present
+        display = self._display
+        self._display = {node_id: display[node_id] for node_id in ids if node_id in display}
+        self.endResetModel()
+
+    def _format_row(self, row):
+        node_id = self._ids[row]
+        info = self._nodes.get(node_id, {})
+        name = info.get("user", {}).get("longName", "(no name)")
+        is_online = bool(info.get("online", True))
+
+        # Reuse the cached text unless a displayed field changed
+        key = (name, is_online)
+        cached = self._display.get(node_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        short_id = node_id.replace("^", "")
+        text = f"{name} [{short_id}] - {_STATUS_TEXT[is_online]}"
+        self._display[node_id] = (key, text)
+        return text
@@ -2,16 +2,29 @@
 Alpha Protocol Network - Configuration Management
 Centralized configuration system with proper validation and defaults.
 """
+import asyncio
+import copy
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
+from functools import cached_property
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ed25519
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to the stdlib json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Parsed config data, keyed by path and invalidated by file mtime.
+# Configs are cached as plain dicts so every load() returns its own APNConfig.
+_CONFIG_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
 @dataclass
 class NodeIdentity:
     """Node identity configuration"""
@@ -75,17 +88,37 @@ class APNConfig:
     radio: RadioConfig
     services: ServicesConfig
     
+    @cached_property
+    def private_key(self):
+        """Node signing key, decoded from private_key_path on first access
+        
+        Loading a saved config only needs node_id and public_key, so the
+        PEM is not parsed until something actually signs.
+        """
+        return load_private_key(Path(self.identity.private_key_path))
+    
     @classmethod
     def load(cls, config_path: Optional[Path] = None) -> 'APNConfig':
         """Load configuration from file or create default"""
         if config_path is None:
             config_path = get_config_dir() / "apn_config.json"
+        config_path = Path(config_path)
+        
+        try:
+            mtime = config_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
             
-        if config_path.exists():
+        if mtime is not None:
+            cached = _CONFIG_CACHE.get(config_path)
+            if cached is not None and cached[0] == mtime:
+                return cls.from_dict(copy.deepcopy(cached[1]))
             try:
                 with config_path.open() as f:
                     data = json.load(f)
-                return cls.from_dict(data)
+                config = cls.from_dict(copy.deepcopy(data))
+                _CONFIG_CACHE[config_path] = (mtime, data)
+                return config
             except Exception as e:
                 logger.error(f"Failed to load config from {config_path}: {e}")
                 
@@ -95,33 +128,22 @@ class APNConfig:
         config.save(config_path)
         return config
     
+    @classmethod
+    async def load_async(cls, config_path: Optional[Path] = None) -> 'APNConfig':
+        """Load configuration without blocking the event loop
+        
+        The file read, JSON parsing and any first-run key generation
+        run in a worker thread.
+        """
+        return await asyncio.to_thread(cls.load, config_path)
+    
     @classmethod
     def create_default(cls) -> 'APNConfig':
         """Create default configuration with generated identity"""
-        identity = NodeIdentity()
+        identity = _load_or_generate_identity(get_config_dir())
         network = NetworkConfig()
         radio = RadioConfig()
         services = ServicesConfig()
-        
-        # Generate identity if not exists
-        config_dir = get_config_dir()
-        private_key_path = config_dir / "node.key"
-        
-        if not private_key_path.exists():
-            private_key, public_key, node_id = generate_node_identity()
-            save_private_key(private_key, private_key_path)
-            identity.private_key_path = str(private_key_path)
-            identity.public_key = public_key
-            identity.node_id = node_id
-            logger.info(f"Generated new node identity: {node_id}")
-        else:
-            private_key = load_private_key(private_key_path)
-            public_key = get_public_key_string(private_key)
-            node_id = generate_node_id_from_key(public_key)
-            identity.private_key_path = str(private_key_path)
-            identity.public_key = public_key
-            identity.node_id = node_id
-            
         return cls(identity, network, radio, services)
     
     @classmethod
@@ -146,28 +168,56 @@ class APNConfig:
         """Save configuration to file"""
         if config_path is None:
             config_path = get_config_dir() / "apn_config.json"
+        config_path = Path(config_path)
             
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with config_path.open("w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        # Serialize in memory and write the file in one call
+        data = self.to_dict()
+        if orjson:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode()
+        config_path.write_bytes(payload)
+        _CONFIG_CACHE[config_path] = (config_path.stat().st_mtime_ns, data)
         logger.info(f"Configuration saved to {config_path}")
 
 def get_config_dir() -> Path:
     """Get the APN configuration directory"""
     return Path.home() / ".apn"
 
+def _load_or_generate_identity(config_dir: Path) -> NodeIdentity:
+    """Load the node key from config_dir, generating it on first run"""
+    identity = NodeIdentity()
+    private_key_path = config_dir / "node.key"
+    
+    if not private_key_path.exists():
+        private_key, public_key, node_id = generate_node_identity()
+        save_private_key(private_key, private_key_path)
+        logger.info(f"Generated new node identity: {node_id}")
+    else:
+        private_key = load_private_key(private_key_path)
+        public_key, node_id = _derive_identity(private_key)
+    
+    identity.private_key_path = str(private_key_path)
+    identity.public_key = public_key
+    identity.node_id = node_id
+    return identity
+
 def generate_node_identity():
     """Generate a new Ed25519 keypair and node ID"""
     private_key = ed25519.Ed25519PrivateKey.generate()
-    public_key = private_key.public_key()
-    public_key_bytes = public_key.public_bytes(
+    public_key_hex, node_id = _derive_identity(private_key)
+    return private_key, public_key_hex, node_id
+
+def _derive_identity(private_key) -> Tuple[str, str]:
+    """Return (public key hex, node ID), exporting the public key once"""
+    public_key_bytes = private_key.public_key().public_bytes(
         encoding=serialization.Encoding.Raw,
         format=serialization.PublicFormat.Raw
     )
     public_key_hex = public_key_bytes.hex()
-    node_id = f"apn_{public_key_hex[:16]}"
-    return private_key, public_key_hex, node_id
+    return public_key_hex, f"apn_{public_key_hex[:16]}"
 
 def save_private_key(private_key, path: Path):
     """Save private key to file with proper permissions"""
@@ -186,16 +236,3 @@ def load_private_key(path: Path):
     """Load private key from file"""
     private_bytes = path.read_bytes()
     return serialization.load_pem_private_key(private_bytes, password=None)
-
-def get_public_key_string(private_key) -> str:
-    """Get public key string from private key"""
-    public_key = private_key.public_key()
-    public_key_bytes = public_key.public_bytes(
-        encoding=serialization.Encoding.Raw,
-        format=serialization.PublicFormat.Raw
-    )
-    return public_key_bytes.hex()
-
-def generate_node_id_from_key(public_key_hex: str) -> str:
-    """Generate node ID from public key"""
-    return f"apn_{public_key_hex[:16]}"
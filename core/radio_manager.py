@@ -14,7 +14,7 @@ from .logging_config import get_logger
 
 logger = get_logger("radio_manager")
 
-@dataclass
+@dataclass(slots=True)
 class RadioDevice:
     """Radio device information"""
     device_id: str
@@ -23,7 +23,7 @@ class RadioDevice:
     status: str  # connected, disconnected, error
     metadata: Dict[str, Any]
 
-@dataclass  
+@dataclass(slots=True)
 class RadioMessage:
     """Standard radio message format"""
     source_id: str
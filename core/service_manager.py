@@ -150,7 +150,7 @@ class ServiceManager:
 @asynccontextmanager
 async def create_service_manager(config_path: Optional[str] = None):
     """Context manager for service manager lifecycle"""
-    config = APNConfig.load(config_path)
+    config = await APNConfig.load_async(config_path)
     manager = ServiceManager(config)
     
     try:
@@ -16,6 +16,7 @@ import uvicorn
 
 from .config import APNConfig
 from .logging_config import get_logger
+from .radio_manager import RadioMessage
 
 logger = get_logger("web_server")
 
@@ -203,7 +204,6 @@ class APNWebServer:
     async def _send_message(self, text: str, dest_id: str):
         """Send message via radio manager"""
         try:
-            from .radio_manager import RadioMessage
             message = RadioMessage(
                 source_id=self.config.identity.node_id,
                 dest_id=dest_id,
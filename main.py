@@ -16,6 +16,7 @@ from core.service_manager import ServiceManager
 
 # GUI imports
 from app.main_window import MainWindow
+from app.ui.theme import APNTheme
 
 # Legacy compatibility
 from app.pages import globals
@@ -42,6 +43,8 @@ def main():
         
         # Start PyQt UI
         app = QApplication(sys.argv)
+        # Palette plus the holographic stylesheet, parsed once for every widget
+        APNTheme.apply(app)
         window = MainWindow(config)
         window.show()
         
@@ -53,7 +56,7 @@ def main():
         sys.exit(exit_code)
         
     except Exception as e:
-        logger.error(f"Application startup error: {e}")
+        logger.exception(f"Application startup error: {e}")
         sys.exit(1)
 
 
@@ -16,6 +16,7 @@ from core.service_manager import ServiceManager
 
 # GUI imports
 from app.main_window import MainWindow
+from app.ui.theme import APNTheme
 
 # Legacy compatibility
 from app.pages import globals
@@ -141,6 +142,8 @@ def main():
 
     # Start PyQt UI
     app = QApplication(sys.argv)
+    # Palette plus the holographic stylesheet, parsed once for every widget
+    APNTheme.apply(app)
     window = MainWindow()
     window.show()
     window.start_service()
@@ -1,3 +1,4 @@
+import secrets
 import threading
 import time
 from PyQt6.QtCore import QObject, pyqtSignal
@@ -5,6 +6,36 @@ import meshtastic.serial_interface
 from pubsub import pub
 import logging
 
+# Payload bytes per mesh frame, leaving room for the frame header
+MESH_TEXT_MTU = 180
+# Pause between frames so the radio is not flooded
+FRAME_DELAY = 0.2
+FRAME_PREFIX = "APN_MSG:"
+MAX_PARTIAL_MESSAGES = 32
+
+def chunk_text(text, mtu=MESH_TEXT_MTU):
+    """Split text into APN_MSG:<tag>:<i>/<n>:<chunk> frames of at most mtu payload bytes"""
+    if len(text.encode('utf-8')) <= mtu:
+        return [text]
+
+    parts = []
+    current = []
+    size = 0
+    for ch in text:
+        ch_size = len(ch.encode('utf-8'))
+        if size + ch_size > mtu:
+            parts.append(''.join(current))
+            current = []
+            size = 0
+        current.append(ch)
+        size += ch_size
+    if current:
+        parts.append(''.join(current))
+
+    tag = secrets.token_hex(4)
+    total = len(parts)
+    return [f"{FRAME_PREFIX}{tag}:{i}/{total}:{part}" for i, part in enumerate(parts, 1)]
+
 class MeshtasticService(QObject):
     new_message = pyqtSignal(str)
     update_nodes = pyqtSignal(dict)
@@ -25,8 +56,19 @@ class MeshtasticService(QObject):
             logger.error(f"Broadcast failed: {e}")
             return False
 
+    @classmethod
+    def sendChunked(cls, text):
+        """Send text as MTU-sized frames; blocks between frames, so call off the UI thread"""
+        for i, frame in enumerate(chunk_text(text)):
+            if i:
+                time.sleep(FRAME_DELAY)
+            if not cls.sendText(frame):
+                return False
+        return True
+
     def __init__(self):
         super().__init__()
+        self._partials = {}
 
     def start(self):
         threading.Thread(target=self._listen, daemon=True).start()
@@ -67,19 +109,18 @@ class MeshtasticService(QObject):
                 nodes = getattr(MeshtasticService.iface, "nodes", None)
                 if nodes is not None:
                     # Only log periodically to avoid spam
-                    import time as time_module
-                    if not hasattr(self, '_last_log_time') or time_module.time() - self._last_log_time > 60:
+                    if not hasattr(self, '_last_log_time') or time.time() - self._last_log_time > 60:
                         online_count = sum(1 for node_info in nodes.values() 
-                                         if node_info.get('lastHeard', 0) > time_module.time() - 1800)
+                                         if node_info.get('lastHeard', 0) > time.time() - 1800)
                         print(f"🔄 Periodic update: {len(nodes)} total, {online_count} recently active")
-                        self._last_log_time = time_module.time()
+                        self._last_log_time = time.time()
                     
                     self.update_nodes.emit(nodes)
                 else:
                     self.update_nodes.emit({})
                     print("⚠️ MeshtasticService.iface.nodes not available")
         except Exception as e:
-            print(f"❌ Failed to initialize Meshtastic interface: {e}")
+            logging.getLogger("MeshtasticService").exception(f"Failed to initialize Meshtastic interface: {e}")
             print("🔍 Make sure a Meshtastic device is connected via USB")
             # Emit empty nodes to prevent UI errors
             self.update_nodes.emit({})
@@ -94,5 +135,33 @@ class MeshtasticService(QObject):
             except Exception:
                 text = "(undecodable)"
             sender = packet.get('fromId', 'unknown')
+            if text.startswith(FRAME_PREFIX):
+                text = self._reassemble(sender, text)
+                if text is None:
+                    return
             msg = f"[{sender}] {text}"
             self.new_message.emit(msg)
+
+    def _reassemble(self, sender, frame):
+        """Collect a chunked frame; returns the full text once every part has arrived"""
+        try:
+            tag, position, part = frame[len(FRAME_PREFIX):].split(':', 2)
+            index, total = (int(x) for x in position.split('/'))
+        except ValueError:
+            return frame  # Not one of our frames, show it as-is
+        if total <= 0 or not 1 <= index <= total:
+            return frame  # Malformed header, show it as-is
+
+        key = (sender, tag)
+        parts = self._partials.get(key)
+        if parts is None:
+            if len(self._partials) >= MAX_PARTIAL_MESSAGES:
+                # Drop the oldest incomplete message
+                del self._partials[next(iter(self._partials))]
+            parts = self._partials[key] = {}
+        parts[index] = part
+
+        if any(i not in parts for i in range(1, total + 1)):
+            return None
+        del self._partials[key]
+        return ''.join(parts[i] for i in range(1, total + 1))